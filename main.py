@@ -6,101 +6,426 @@ ENHANCED VERSION with FPS/MS toggle and fixed GIF export
 
 import sys
 import os
+import io
+import gc
+import time
 import numpy as np
+from math import gcd
 from pathlib import Path
-from PIL import Image, ImageQt
+from PIL import Image
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QPushButton, 
     QFileDialog, QVBoxLayout, QHBoxLayout, QSlider, QMessageBox, 
     QSpinBox, QRadioButton, QButtonGroup, QGroupBox, QGridLayout,
-    QTabWidget, QLineEdit, QProgressBar, QFrame, QDoubleSpinBox
+    QTabWidget, QLineEdit, QProgressBar, QFrame, QDoubleSpinBox, QCheckBox
 )
-from PySide6.QtCore import Qt, QTimer, QThread, Signal, QObject
-from PySide6.QtGui import QPixmap, QIcon
+from PySide6.QtCore import (
+    Qt, QTimer, QThread, Signal, QObject, QEvent, QElapsedTimer, QRunnable, QThreadPool
+)
+from PySide6.QtGui import QPixmap, QIcon, QImage
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from collections import deque, OrderedDict
 import multiprocessing
 
 
+# Spritesheet pixels shared with splitter pool processes, and each pool
+# process's tile scratch (all set by attach_sheet)
+_worker_shm = None
+_worker_sheet = None
+_worker_scratch = None
+
+# Memory budget for each tab's cache of scaled preview pixmaps
+PREVIEW_CACHE_BYTES = 96 * 1024 * 1024
+
+
+def infer_frame_dims(width, height, common_sizes=(8, 16, 24, 32, 48, 64, 96, 128, 192, 256, 384, 512)):
+    """Intelligently infer frame dimensions from spritesheet size"""
+    # Square frames fit exactly when the size divides both sides, i.e. divides
+    # their greatest common divisor
+    g = gcd(width, height)
+    square = next((size for size in reversed(common_sizes) if g % size == 0), None)
+    if square:
+        best_w = best_h = square
+    else:
+        # Otherwise pick the largest fitting size for each side on its own
+        best_w = next((size for size in reversed(common_sizes) if width % size == 0), 32)
+        best_h = next((size for size in reversed(common_sizes) if height % size == 0), 32)
+    
+    # Sanity check - don't suggest frames larger than the image
+    return min(best_w, width), min(best_h, height)
+
+
+def classify_tiles(sheet_np, frame_w, frame_h, frames_x, frames_y):
+    """Return a (frames_y, frames_x) mask of the non-empty tiles of an RGBA sheet
+    
+    A tile is kept when its alpha is above 10 in at least one pixel and in
+    at least 1% of its pixels; anything less counts as empty.
+    """
+    # Sample every 8th row and column of each tile first. A tile whose samples
+    # are all visible is kept - the samples alone are over 1% of its pixels.
+    # When that holds for every tile (solid sheets) the full count is skipped;
+    # a blank sample proves nothing, since a sprite can sit between samples
+    alpha = sheet_np[:frames_y * frame_h, :frames_x * frame_w, 3]
+    samples = alpha.reshape(frames_y, frame_h, frames_x, frame_w)[:, ::8, :, ::8]
+    solid = samples.min(axis=(1, 3)) > 10
+    if solid.all():
+        return solid
+    
+    # Threshold the alpha plane once, then sum it down in two contiguous
+    # passes - tile rows first, then tile columns - rather than reducing a
+    # strided 4D tile view
+    visible = (sheet_np[:frames_y * frame_h, :, 3] > 10).view(np.uint8)
+    row_counts = visible.reshape(frames_y, frame_h, -1).sum(axis=1, dtype=np.int32)
+    counts = row_counts[:, :frames_x * frame_w].reshape(frames_y, frames_x, frame_w).sum(axis=2)
+    
+    return (counts > 0) & (counts >= frame_w * frame_h * 0.01)
+
+
+def cache_preview(cache, key, pixmap):
+    """Add a scaled preview to an LRU OrderedDict, dropping the least recently
+    used entries once the cache would exceed PREVIEW_CACHE_BYTES"""
+    cache[key] = pixmap
+    limit = max(1, PREVIEW_CACHE_BYTES // max(1, pixmap.width() * pixmap.height() * 4))
+    while len(cache) > limit:
+        cache.popitem(last=False)
+
+
+def decode_rgba(path):
+    """Decode an image file into an (H, W, 4) RGBA array"""
+    with Image.open(path) as img:
+        if img.mode != 'RGBA':
+            img = img.convert('RGBA')
+        return np.asarray(img)
+
+
+def frame_scratch(shape):
+    """Return a (buffer, image) pair for encoding tiles of one shape
+    
+    The image wraps the buffer's memory, so copying a tile into the buffer is
+    all it takes to save it - no per-tile allocation. Each split (or pool
+    process) makes its own and reuses it for every tile.
+    """
+    buffer = np.empty(shape, dtype=np.uint8)
+    image = Image.frombuffer('RGBA', (shape[1], shape[0]), buffer, 'raw', 'RGBA', 0, 1)
+    return buffer, image
+
+
+def attach_sheet(shm_name, shape, tile_shape):
+    """Pool initializer - map the shared spritesheet into this process"""
+    global _worker_shm, _worker_sheet, _worker_scratch
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_sheet = np.ndarray(shape, dtype=np.uint8, buffer=_worker_shm.buf)
+    _worker_scratch = frame_scratch(tile_shape)
+
+
+def encode_tile(image, image_format, compress_level):
+    """Encode a tile image as PNG (deflated) or TGA (raw, no compression)
+    
+    Returns the encoded file as bytes the caller owns, so they can be handed
+    to another thread for writing.
+    """
+    out = io.BytesIO()
+    if image_format == "PNG":
+        image.save(out, "PNG", optimize=False, compress_level=compress_level)
+    else:
+        image.save(out, image_format)
+    return out.getvalue()
+
+
+def save_tile(image, output_path, image_format, compress_level):
+    """Encode a tile in memory and write it with a single write call, instead
+    of the many small writes Pillow makes while encoding to a file"""
+    write_file(output_path, encode_tile(image, image_format, compress_level))
+
+
+def write_file(path, data):
+    """Write a whole file in one call (used from I/O threads)"""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def save_frame(args):
+    """Worker function for parallel frame saving (runs in a pool process)"""
+    try:
+        left, top, right, bottom, output_path, image_format, compress_level = args
+        tile = _worker_sheet[top:bottom, left:right]
+        
+        # Empty frames were already filtered out by classify_tiles
+        buffer, image = _worker_scratch
+        np.copyto(buffer, tile)
+        save_tile(image, output_path, image_format, compress_level)
+        return True
+    except Exception as e:
+        print(f"Error saving frame: {e}")
+        return False
+
+
+def save_frame_batch(batch):
+    """Save a batch of frames in a pool process; returns (processed, saved)"""
+    saved = 0
+    for args in batch:
+        if save_frame(args):
+            saved += 1
+    return len(batch), saved
+
+
+def quantize_rgb(rgb):
+    """Quantize an RGB image to at most 255 colors, leaving one index free"""
+    # libimagequant is faster and gives a tighter palette, but it is an
+    # optional Pillow build dependency
+    try:
+        return rgb.quantize(
+            colors=255, method=Image.Quantize.LIBIMAGEQUANT, dither=Image.Dither.NONE
+        )
+    except ValueError:
+        return rgb.quantize(
+            colors=255, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE
+        )
+
+
+def prep_gif_frame(frame, max_width, max_height, palette_ref):
+    """Center an RGBA frame on the export canvas and map it onto the shared palette"""
+    if frame.size == (max_width, max_height):
+        # The frame already covers the canvas - use it as is
+        canvas = frame
+    else:
+        # Create a canvas of max size with transparency
+        canvas = Image.new('RGBA', (max_width, max_height), (0, 0, 0, 0))
+        
+        # Center the frame on the canvas
+        x_offset = (max_width - frame.width) // 2
+        y_offset = (max_height - frame.height) // 2
+        canvas.paste(frame, (x_offset, y_offset), frame)
+    
+    # Fully opaque frames need no compositing onto white and have no
+    # transparent pixels to mark
+    alpha = canvas.getchannel('A')
+    if alpha.getextrema()[0] == 255:
+        return canvas.convert('RGB').quantize(palette=palette_ref, dither=Image.Dither.NONE)
+    
+    # Convert to proper mode for GIF; index 255 is left free by the palette
+    # and marks transparent pixels
+    rgb_frame = Image.new('RGB', canvas.size, (255, 255, 255))
+    rgb_frame.paste(canvas, mask=alpha)
+    p_frame = rgb_frame.quantize(palette=palette_ref, dither=Image.Dither.NONE)
+    p_frame.paste(255, mask=alpha.point([255] * 128 + [0] * 128))
+    p_frame.info['transparency'] = 255
+    return p_frame
+
+
+def quantize_shared_palette(frames):
+    """Quantize an (N, H, W, 4) RGBA frame stack to one shared GIF palette
+    
+    Returns a list of (H, W) palette-index arrays and the palette bytes.
+    Index 0 is reserved for transparency.
+    """
+    count = len(frames)
+    
+    # Stack all frames side by side so the palette is built only once
+    mega = np.hstack(frames)
+    mega_img = Image.fromarray(mega)
+    
+    # Flatten onto white, as the per-frame export used to do
+    rgb = Image.new('RGB', mega_img.size, (255, 255, 255))
+    rgb.paste(mega_img, mask=mega_img.getchannel('A'))
+    
+    mega_p = quantize_rgb(rgb)
+    
+    # Shift indices by one to free index 0 for transparent pixels
+    indices = np.asarray(mega_p) + np.uint8(1)
+    indices[mega[:, :, 3] < 128] = 0
+    
+    palette = bytes(3) + bytes(mega_p.getpalette()[:255 * 3])
+    palette = palette.ljust(256 * 3, b'\0')
+    
+    return np.hsplit(indices, count), palette
+
+
+def gif_delta_frames(indices, duration):
+    """Turn full palette-index frames into inter-frame deltas for GIF export
+    
+    Pixels unchanged since the previous frame become transparent (index 0),
+    which LZW compresses to almost nothing, and Pillow crops each frame to
+    the box that changed. A delta can't erase pixels, so the frame before
+    one that hides visible pixels is disposed to background instead.
+    
+    Returns the frames, per-frame durations and per-frame disposal methods.
+    """
+    # Merge runs of identical frames so every written frame changes something
+    frames = [indices[0]]
+    durations = [duration]
+    for frame in indices[1:]:
+        if np.array_equal(frame, frames[-1]):
+            durations[-1] += duration
+        else:
+            frames.append(frame)
+            durations.append(duration)
+    
+    count = len(frames)
+    
+    # Keep (1) unless the next frame erases pixels; the last frame is always
+    # disposed (2) so the loop restarts from a clean canvas
+    disposal = [2] * count
+    for i in range(count - 1):
+        if not np.any((frames[i + 1] == 0) & (frames[i] != 0)):
+            disposal[i] = 1
+    
+    deltas = [frames[0]]
+    for i in range(1, count):
+        prev, frame = frames[i - 1], frames[i]
+        
+        if disposal[i - 1] == 2:
+            # Drawn on a cleared canvas, so it must be complete
+            delta = frame
+        else:
+            changed = frame != prev
+            if disposal[i] == 2:
+                # Also redraw unchanged pixels the previous delta skipped so
+                # this frame's box covers everything its disposal must clear
+                changed |= deltas[-1] == 0
+            delta = np.where(changed, frame, 0).astype(np.uint8)
+        
+        if np.array_equal(delta, deltas[-1]):
+            # Pillow would merge these two frames - write full frames instead
+            return frames, durations, [2] * count
+        
+        deltas.append(delta)
+    
+    return deltas, durations, disposal
+
+
+class FrameDimsGroup(QGroupBox):
+    """Frame Dimensions box - width/height spinboxes plus an action button"""
+    
+    def __init__(self, frame_width, frame_height, on_width, on_height,
+                 button_text, on_button, horizontal=False):
+        super().__init__("Frame Dimensions")
+        dims_layout = QGridLayout()
+        
+        dims_layout.addWidget(QLabel("Width:"), 0, 0)
+        self.width_spinbox = QSpinBox()
+        self.width_spinbox.setRange(1, 10000)
+        self.width_spinbox.setValue(frame_width)
+        self.width_spinbox.valueChanged.connect(on_width)
+        dims_layout.addWidget(self.width_spinbox, 0, 1)
+        
+        self.height_spinbox = QSpinBox()
+        self.height_spinbox.setRange(1, 10000)
+        self.height_spinbox.setValue(frame_height)
+        self.height_spinbox.valueChanged.connect(on_height)
+        
+        button = QPushButton(button_text)
+        button.clicked.connect(on_button)
+        
+        if horizontal:
+            # Everything on one row
+            dims_layout.addWidget(QLabel("Height:"), 0, 2)
+            dims_layout.addWidget(self.height_spinbox, 0, 3)
+            dims_layout.addWidget(button, 0, 4)
+        else:
+            dims_layout.addWidget(QLabel("Height:"), 1, 0)
+            dims_layout.addWidget(self.height_spinbox, 1, 1)
+            dims_layout.addWidget(button, 2, 0, 1, 2)
+        
+        self.setLayout(dims_layout)
+
+
+class SheetLoadSignals(QObject):
+    """Signals for SheetLoadTask (QRunnable can't emit on its own)"""
+    loaded = Signal(str, object)
+
+
+class SheetLoadTask(QRunnable):
+    """Decodes a spritesheet to RGBA on the global thread pool"""
+    
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = SheetLoadSignals()
+    
+    def run(self):
+        try:
+            self.signals.loaded.emit(self.path, decode_rgba(self.path))
+        except Exception as e:
+            print(f"Error decoding spritesheet: {e}")
+            # Still report back, so the tab knows the decode is over
+            self.signals.loaded.emit(self.path, None)
+
+
 class SplitterWorker(QObject):
     """Worker for splitting spritesheet in a separate thread"""
     progress = Signal(int)
     finished = Signal(int, str)
     error = Signal(str)
     
-    def __init__(self, spritesheet, frame_w, frame_h, output_dir, prefix, start, pad):
+    def __init__(self, sheet_np, frame_w, frame_h, output_dir, prefix, start, pad,
+                 compress_level=6, sheet_path=None, image_format="PNG"):
         super().__init__()
-        self.spritesheet = spritesheet
+        self.sheet_np = sheet_np  # (height, width, 4) RGBA pixels, or None
+        self.sheet_path = sheet_path  # Decoded here when sheet_np is None
         self.frame_w = frame_w
         self.frame_h = frame_h
         self.output_dir = output_dir
         self.prefix = prefix
         self.start = start
         self.pad = pad
+        self.compress_level = compress_level  # zlib level for the PNGs
+        self.image_format = image_format  # "PNG" or "TGA"
         self._should_stop = False
+        self._last_pct = -1
+        self._emit_timer = QElapsedTimer()
     
     def stop(self):
         """Request the worker to stop"""
         self._should_stop = True
     
-    def is_frame_empty(self, frame):
-        """Check if a frame is empty (fully transparent or uniform color)"""
-        try:
-            # Convert to RGBA if needed
-            if frame.mode != 'RGBA':
-                frame_rgba = frame.convert('RGBA')
-            else:
-                frame_rgba = frame
-            
-            # Get the alpha channel
-            alpha = frame_rgba.split()[-1]
-            alpha_data = alpha.getdata()
-            
-            # Check if completely transparent
-            if max(alpha_data) == 0:
-                return True
-            
-            # Get pixel data
-            pixels = list(frame_rgba.getdata())
-            
-            # Check if all non-transparent pixels are the same color
-            non_transparent = [p for p in pixels if p[3] > 10]  # Alpha > 10
-            
-            if len(non_transparent) == 0:
-                return True
-            
-            # If less than 1% of pixels are non-transparent, consider empty
-            total_pixels = frame.width * frame.height
-            if len(non_transparent) < total_pixels * 0.01:
-                return True
-            
-            return False
-            
-        except Exception as e:
-            print(f"Error checking if frame is empty: {e}")
-            return False
+    def emit_progress(self, pct):
+        """Emit progress only when it changes, at most every 30ms (100% always)"""
+        if pct == self._last_pct:
+            return
+        if pct < 100 and self._emit_timer.isValid() and self._emit_timer.elapsed() < 30:
+            return
+        self._last_pct = pct
+        self._emit_timer.start()
+        self.progress.emit(pct)
     
-    def save_frame(self, args):
-        """Worker function for parallel frame saving"""
-        if self._should_stop:
-            return False
+    def validate_output_path(self):
+        """Validate that output path is writable, creating it if needed
+        
+        Runs in the worker thread, since these filesystem calls can block for
+        seconds on network shares.
+        """
+        output_dir = self.output_dir
+        
+        # Check if parent exists
+        if not output_dir.parent.exists():
+            return False, "Parent directory does not exist"
+        
+        # Try to create directory
         try:
-            spritesheet, left, top, right, bottom, output_path = args
-            frame = spritesheet.crop((left, top, right, bottom))
-            
-            # Skip empty frames
-            if self.is_frame_empty(frame):
-                return False
-            
-            frame.save(output_path, "PNG", optimize=False)
-            return True
+            output_dir.mkdir(parents=True, exist_ok=True)
         except Exception as e:
-            print(f"Error saving frame: {e}")
-            return False
+            return False, f"Cannot create output directory: {str(e)}"
+        
+        # Check if writable
+        if not os.access(output_dir, os.W_OK):
+            return False, "Output directory is not writable"
+        
+        return True, ""
     
     def run(self):
         try:
-            sheet_width, sheet_height = self.spritesheet.size
+            valid, error_msg = self.validate_output_path()
+            if not valid:
+                self.error.emit(f"Invalid output path:\n{error_msg}")
+                return
+            
+            sheet_np = self.sheet_np
+            if sheet_np is None:
+                sheet_np = decode_rgba(self.sheet_path)
+            sheet_height, sheet_width = sheet_np.shape[:2]
             
             frames_x = sheet_width // self.frame_w
             frames_y = sheet_height // self.frame_h
@@ -110,77 +435,209 @@ class SplitterWorker(QObject):
                 self.error.emit("Frame dimensions are larger than spritesheet size")
                 return
             
-            # Create output directory
-            self.output_dir.mkdir(parents=True, exist_ok=True)
-            
-            if total > 100:
-                # Use parallel processing for large spritesheets
-                tasks = []
-                for row in range(frames_y):
-                    for col in range(frames_x):
-                        if self._should_stop:
-                            self.error.emit("Operation cancelled")
-                            return
-                        
-                        left = col * self.frame_w
-                        top = row * self.frame_h
-                        right = left + self.frame_w
-                        bottom = top + self.frame_h
-                        
-                        num = self.start + (row * frames_x + col)
-                        filename = f"{self.prefix}_{str(num).zfill(self.pad)}.png"
-                        output_path = self.output_dir / filename
-                        
-                        tasks.append((self.spritesheet, left, top, right, bottom, output_path))
+            # Path pieces, built once - only the zero-padded number varies, and
+            # the prefix never goes through a format string
+            head = os.path.join(self.output_dir, self.prefix + "_")
+            tail = "." + self.image_format.lower()
+            pad_num = f"%0{self.pad}d".__mod__
+            
+            # Skip empty frames before choosing how to save, then compute the
+            # position (row-major) and output path of every kept frame up
+            # front, so the loops below only slice and save. Kept frames are
+            # numbered consecutively whichever path saves them
+            keep = classify_tiles(sheet_np, self.frame_w, self.frame_h, frames_x, frames_y)
+            rows, cols = np.nonzero(keep)
+            lefts = (cols * self.frame_w).tolist()
+            tops = (rows * self.frame_h).tolist()
+            kept = len(lefts)
+            paths = [head + pad_num(num) + tail for num in range(self.start, self.start + kept)]
+            
+            # Use the pool for many frames, or for a few large ones - what
+            # matters is how many pixels have to be encoded
+            use_pool = kept > 100 or (kept >= 4 and sheet_np.nbytes >= 16 * 1024 * 1024)
+            
+            if use_pool:
+                # Use process-based parallelism for large spritesheets - PNG
+                # encoding is CPU-bound and would serialize on the GIL in threads
+                tasks = [
+                    (left, top, left + self.frame_w, top + self.frame_h,
+                     path, self.image_format, self.compress_level)
+                    for left, top, path in zip(lefts, tops, paths)
+                ]
                 
-                max_workers = min(multiprocessing.cpu_count() * 2, 16)
-                with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    completed = 0
-                    saved = 0
-                    for result in executor.map(self.save_frame, tasks):
-                        if self._should_stop:
-                            executor.shutdown(wait=False, cancel_futures=True)
-                            self.error.emit("Operation cancelled")
-                            return
-                        completed += 1
-                        if result:
-                            saved += 1
-                        progress_pct = int((completed / total) * 100)
-                        self.progress.emit(progress_pct)
+                # Share the sheet with the pool processes without pickling it
+                shm = shared_memory.SharedMemory(create=True, size=sheet_np.nbytes)
+                shared_sheet = np.ndarray(sheet_np.shape, dtype=np.uint8, buffer=shm.buf)
+                try:
+                    shared_sheet[:] = sheet_np
+                    
+                    max_workers = min(multiprocessing.cpu_count(), 16, kept)
+                    chunk = max(1, kept // (max_workers * 4))
+                    with ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        initializer=attach_sheet,
+                        initargs=(shm.name, sheet_np.shape, (self.frame_h, self.frame_w, 4))
+                    ) as executor:
+                        # Submit in batches and handle them as they finish, so
+                        # one slow frame doesn't hold back progress or cancel
+                        futures = [
+                            executor.submit(save_frame_batch, tasks[i:i + chunk])
+                            for i in range(0, kept, chunk)
+                        ]
+                        completed = 0
+                        saved = 0
+                        for future in as_completed(futures):
+                            if self._should_stop:
+                                for pending in futures:
+                                    pending.cancel()
+                                self.error.emit("Operation cancelled")
+                                return
+                            processed, batch_saved = future.result()
+                            completed += processed
+                            saved += batch_saved
+                            progress_pct = int((completed / kept) * 100)
+                            self.emit_progress(progress_pct)
+                finally:
+                    del shared_sheet
+                    shm.close()
+                    shm.unlink()
                 
                 count = saved
             else:
-                # Sequential processing for small spritesheets
-                count = 0
-                frame_num = 0
-                for row in range(frames_y):
-                    for col in range(frames_x):
+                # Sequential processing for small spritesheets - tiles are
+                # encoded here while I/O threads write the previous ones
+                frame_w, frame_h = self.frame_w, self.frame_h
+                buffer, image = frame_scratch((frame_h, frame_w, 4))
+                # Only look at progress once per percent of the frames
+                step = max(1, kept // 100)
+                with ThreadPoolExecutor(max_workers=4) as io_pool:
+                    # Bound the encoded tiles waiting on the disk
+                    writes = deque()
+                    for frame_num, (left, top, path) in enumerate(zip(lefts, tops, paths), 1):
                         if self._should_stop:
                             self.error.emit("Operation cancelled")
                             return
                         
-                        left = col * self.frame_w
-                        top = row * self.frame_h
-                        right = left + self.frame_w
-                        bottom = top + self.frame_h
+                        np.copyto(buffer, sheet_np[top:top + frame_h, left:left + frame_w])
+                        encoded = encode_tile(image, self.image_format, self.compress_level)
+                        if len(writes) >= 16:
+                            writes.popleft().result()
+                        writes.append(io_pool.submit(write_file, path, encoded))
                         
-                        frame = self.spritesheet.crop((left, top, right, bottom))
-                        
-                        # Skip empty frames
-                        if not self.is_frame_empty(frame):
-                            num = self.start + count
-                            filename = f"{self.prefix}_{str(num).zfill(self.pad)}.png"
-                            frame.save(self.output_dir / filename, "PNG", optimize=False)
-                            count += 1
-                        
-                        frame_num += 1
-                        progress_pct = int((frame_num / total) * 100)
-                        self.progress.emit(progress_pct)
+                        if frame_num % step == 0 or frame_num == kept:
+                            progress_pct = int((frame_num / kept) * 100)
+                            self.emit_progress(progress_pct)
+                    
+                    # Surface any write error before reporting success
+                    for write in writes:
+                        write.result()
+                count = kept
             
             self.finished.emit(count, str(self.output_dir))
             
         except Exception as e:
             self.error.emit(str(e))
+        finally:
+            # Let go of the sheet as soon as the work is done
+            self.sheet_np = None
+
+
+class GifExportWorker(QObject):
+    """Worker for encoding the sheet-to-GIF export in a separate thread"""
+    progress = Signal(int)
+    finished = Signal(str)
+    error = Signal(str)
+    
+    def __init__(self, frames, path, duration, max_width, max_height):
+        super().__init__()
+        self.frames = frames
+        self.path = path
+        self.duration = duration
+        self.max_width = max_width
+        self.max_height = max_height
+        self._should_stop = False
+    
+    def stop(self):
+        """Request the worker to stop"""
+        self._should_stop = True
+    
+    def iter_export_frames(self, executor, window, palette_ref):
+        """Yield prepared frames in order, with at most `window` in flight"""
+        total = len(self.frames)
+        
+        def submit(frame):
+            return executor.submit(
+                prep_gif_frame, frame, self.max_width, self.max_height, palette_ref
+            )
+        
+        pending = deque(submit(frame) for frame in self.frames[:window])
+        next_index = len(pending)
+        completed = 0
+        last_pct = -1
+        
+        while pending:
+            if self._should_stop:
+                for future in pending:
+                    future.cancel()
+                raise RuntimeError("Operation cancelled")
+            
+            p_frame = pending.popleft().result()
+            if next_index < total:
+                pending.append(submit(self.frames[next_index]))
+                next_index += 1
+            
+            completed += 1
+            progress_pct = int((completed / total) * 99)
+            if progress_pct != last_pct:
+                last_pct = progress_pct
+                self.progress.emit(progress_pct)
+            
+            yield p_frame
+    
+    def run(self):
+        try:
+            max_width, max_height = self.max_width, self.max_height
+            total = len(self.frames)
+            
+            # Build one palette for the whole animation from all frames stacked
+            # vertically, instead of a separate adaptive palette per frame
+            composite = Image.new('RGBA', (max_width, max_height * total), (0, 0, 0, 0))
+            for i, frame in enumerate(self.frames):
+                x_offset = (max_width - frame.width) // 2
+                y_offset = (max_height - frame.height) // 2 + i * max_height
+                composite.paste(frame, (x_offset, y_offset))
+            rgb_composite = Image.new('RGB', composite.size, (255, 255, 255))
+            rgb_composite.paste(composite, mask=composite.getchannel('A'))
+            palette_ref = quantize_rgb(rgb_composite)
+            del composite, rgb_composite
+            
+            # Prepare frames for GIF export in parallel - Pillow releases the
+            # GIL inside its image operations, so threads scale here. All
+            # frames are centered on the same canvas size. Prepared frames are
+            # handed to the writer in order from a bounded window, so no list
+            # of them is built here; Pillow's GIF writer still collects every
+            # (cropped) frame before writing, so peak memory is not reduced
+            max_workers = min(multiprocessing.cpu_count(), 8)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                export_frames = self.iter_export_frames(executor, max_workers * 2, palette_ref)
+                
+                # Save GIF
+                next(export_frames).save(
+                    self.path,
+                    save_all=True,
+                    append_images=export_frames,
+                    duration=self.duration,
+                    loop=0,
+                    disposal=2,
+                    transparency=255,
+                    optimize=False
+                )
+            
+            self.progress.emit(100)
+            self.finished.emit(self.path)
+            
+        except Exception as e:
+            self.error.emit(str(e))
 
 
 class CoinAnimatorTab(QWidget):
@@ -189,7 +646,9 @@ class CoinAnimatorTab(QWidget):
     def __init__(self):
         super().__init__()
         self.image = None
-        self.frames = []
+        self.frames_np = None  # (frame_count, height, width, 4) RGBA tensor
+        self._shown_frame = None
+        self._scaled_cache = OrderedDict()  # Frame index -> preview-sized pixmap (LRU)
         self.frame_index = 0
         self.total_frames = 60
         self.fps = 30
@@ -197,7 +656,9 @@ class CoinAnimatorTab(QWidget):
         self.use_fps = True  # True for FPS mode, False for MS mode
         
         self.timer = QTimer()
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self.next_frame)
+        self._accum_ms = 0.0  # Timer time not yet turned into frames
         
         self.init_ui()
     
@@ -234,6 +695,7 @@ class CoinAnimatorTab(QWidget):
             font-size: 13px;
         """)
         self.preview.setMinimumSize(500, 400)
+        self.preview.installEventFilter(self)
         preview_layout.addWidget(self.preview)
         
         layout.addWidget(preview_container, 3)
@@ -407,7 +869,7 @@ class CoinAnimatorTab(QWidget):
         # Update timer if running
         if self.timer.isActive():
             self.timer.stop()
-            interval = int(self.ms_per_frame)
+            interval = int(round(self.ms_per_frame))
             self.timer.start(interval)
     
     def update_ms(self, value):
@@ -423,7 +885,7 @@ class CoinAnimatorTab(QWidget):
         # Update timer if running
         if self.timer.isActive():
             self.timer.stop()
-            interval = int(self.ms_per_frame)
+            interval = int(round(self.ms_per_frame))
             self.timer.start(interval)
     
     def update_frame_count(self, value):
@@ -464,76 +926,137 @@ class CoinAnimatorTab(QWidget):
             return
         
         try:
-            self.frames = []
             w, h = self.image.size
+            count = self.total_frames
             
-            for i in range(self.total_frames):
-                # Calculate angle for full rotation (0 to 2π)
-                angle = 2 * np.pi * i / self.total_frames
-                
-                # Horizontal compression based on cosine (simulates 3D rotation)
-                scale_x = np.cos(angle)
-                
-                # Use absolute value for width calculation
-                abs_scale_x = max(abs(scale_x), 0.01)  # Minimum width to avoid invisible frames
-                
-                # Calculate new width, keep height the same
-                new_w = max(1, int(w * abs_scale_x))
-                
-                # Resize with horizontal compression only
-                frame = self.image.resize((new_w, h), Image.Resampling.LANCZOS)
+            # Calculate angles for full rotation (0 to 2π)
+            angles = 2 * np.pi * np.arange(count) / count
+            
+            # Horizontal compression based on cosine (simulates 3D rotation)
+            scales_x = np.cos(angles)
+            
+            # Use absolute value for width calculation
+            abs_scales_x = np.maximum(np.abs(scales_x), 0.01)  # Minimum width to avoid invisible frames
+            
+            # Calculate new widths, keep height the same
+            widths = np.maximum(1, (w * abs_scales_x).astype(int))
+            
+            # All frames live in one contiguous buffer, centered on a w×h canvas
+            frames_np = np.zeros((count, h, w, 4), dtype=np.uint8)
+            
+            # Pillow premultiplies alpha on every RGBA resize; do it once here
+            premultiplied = self.image.convert('RGBa')
+            
+            # cos(θ) is symmetric, so most widths occur more than once - remember
+            # the first frame with each width and copy from it instead of resizing
+            first_with_width = {}
+            
+            for i in range(count):
+                new_w = int(widths[i])
+                x_offset = (w - new_w) // 2
+                flipped = scales_x[i] < 0
                 
-                # Flip horizontally when on the back side of the coin
-                if scale_x < 0:
-                    frame = frame.transpose(Image.FLIP_LEFT_RIGHT)
+                if new_w in first_with_width:
+                    j = first_with_width[new_w]
+                    frame = frames_np[j, :, x_offset:x_offset + new_w]
+                    
+                    # Mirror if the earlier frame faces the other way
+                    if (scales_x[j] < 0) != flipped:
+                        frame = frame[:, ::-1]
+                else:
+                    first_with_width[new_w] = i
+                    
+                    # Resize with horizontal compression only
+                    if new_w == w:
+                        frame = np.asarray(self.image)
+                    else:
+                        resized = premultiplied.resize((new_w, h), Image.Resampling.LANCZOS)
+                        frame = np.asarray(resized.convert('RGBA'))
+                    
+                    # Flip horizontally when on the back side of the coin - a
+                    # negative-stride view, written once by the copy below
+                    if flipped:
+                        frame = frame[:, ::-1]
                 
-                self.frames.append(frame)
+                frames_np[i, :, x_offset:x_offset + new_w] = frame
+            
+            self.frames_np = frames_np
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to generate frames:\n{str(e)}")
-            self.frames = []
+            self.frames_np = None
+        
+        self._scaled_cache = OrderedDict()
     
     def show_frame(self, index):
         """Display a specific frame"""
-        if not self.frames or index >= len(self.frames):
+        if self.frames_np is None or index >= len(self.frames_np):
             return
         
         try:
-            qt_img = ImageQt.ImageQt(self.frames[index])
-            pix = QPixmap.fromImage(qt_img)
-            self.preview.setPixmap(
-                pix.scaled(
+            # Scaled frames are cached (bounded, until the preview is resized)
+            scaled = self._scaled_cache.get(index)
+            if scaled is not None:
+                self._scaled_cache.move_to_end(index)
+            else:
+                # Wrap the frame's memory directly instead of going through
+                # ImageQt; keep the array referenced while Qt reads from it
+                self._shown_frame = self.frames_np[index]
+                height, width = self._shown_frame.shape[:2]
+                qt_img = QImage(
+                    self._shown_frame.data, width, height,
+                    self._shown_frame.strides[0], QImage.Format_RGBA8888
+                )
+                pix = QPixmap.fromImage(qt_img)
+                scaled = pix.scaled(
                     self.preview.size(),
                     Qt.KeepAspectRatio,
                     Qt.SmoothTransformation
                 )
-            )
+                cache_preview(self._scaled_cache, index, scaled)
+            
+            self.preview.setPixmap(scaled)
         except Exception as e:
             print(f"Error displaying frame: {e}")
     
+    def eventFilter(self, obj, event):
+        """Drop cached preview pixmaps when the preview is resized"""
+        if obj is self.preview and event.type() == QEvent.Resize:
+            self._scaled_cache = OrderedDict()
+        return super().eventFilter(obj, event)
+    
     def next_frame(self):
-        """Advance to the next frame"""
-        if self.frames:
-            self.frame_index = (self.frame_index + 1) % len(self.frames)
+        """Advance by however many frames the elapsed timer time covers"""
+        if self.frames_np is not None:
+            # The timer interval is whole milliseconds; carry the remainder so
+            # the average rate matches ms_per_frame exactly
+            self._accum_ms += self.timer.interval()
+            steps = int(self._accum_ms // self.ms_per_frame)
+            if steps == 0:
+                return
+            self._accum_ms -= steps * self.ms_per_frame
+            self.frame_index = (self.frame_index + steps) % len(self.frames_np)
             self.show_frame(self.frame_index)
     
     def toggle_playback(self):
         """Toggle animation playback"""
-        if not self.frames:
+        if self.frames_np is None:
             return
         
         if self.timer.isActive():
             self.timer.stop()
             self.play_pause_btn.setText("▶ Play")
         else:
-            interval = int(self.ms_per_frame)
+            interval = int(round(self.ms_per_frame))
+            self._accum_ms = 0.0
             self.timer.start(interval)
             self.play_pause_btn.setText("⏸ Pause")
     
     def play(self):
         """Start animation playback"""
-        if not self.frames:
+        if self.frames_np is None:
             return
-        interval = int(self.ms_per_frame)
+        interval = int(round(self.ms_per_frame))
+        self._accum_ms = 0.0
         self.timer.start(interval)
         self.play_pause_btn.setText("⏸ Pause")
     
@@ -555,14 +1078,14 @@ class CoinAnimatorTab(QWidget):
                 self.image.close()
             except:
                 pass
-        self.frames = []
+        self.frames_np = None
+        self._scaled_cache = OrderedDict()
     
     def estimate_gif_size(self, frames, duration):
         """Estimate the file size of the GIF in MB"""
         try:
-            # Find max dimensions
-            max_width = max(f.width for f in frames)
-            max_height = max(f.height for f in frames)
+            # All frames share the same canvas size
+            max_height, max_width = frames.shape[1:3]
             
             # Rough estimation: 
             # Each frame in palette mode ≈ width × height bytes (with compression)
@@ -585,13 +1108,13 @@ class CoinAnimatorTab(QWidget):
     
     def export_gif(self):
         """Export animation as GIF with proper transparency and timing"""
-        if not self.frames:
+        if self.frames_np is None:
             QMessageBox.warning(self, "No Frames", "Please load an image first!")
             return
         
         # Estimate file size
         duration = int(round(self.ms_per_frame))
-        estimated_size = self.estimate_gif_size(self.frames, duration)
+        estimated_size = self.estimate_gif_size(self.frames_np, duration)
         
         timestamp = datetime.now().strftime("%H%M%S")
         default_name = f"spin_{timestamp}.gif"
@@ -607,46 +1130,36 @@ class CoinAnimatorTab(QWidget):
             path += '.gif'
         
         try:
-            # Find maximum dimensions across all frames
-            max_width = max(f.width for f in self.frames)
-            max_height = max(f.height for f in self.frames)
+            # Frames are already centered on a shared canvas size
+            max_height, max_width = self.frames_np.shape[1:3]
+            
+            # Quantize all frames once against a single shared palette
+            indices, palette = quantize_shared_palette(self.frames_np)
+            
+            # Only store what changes between frames
+            deltas, durations, disposal = gif_delta_frames(indices, duration)
             
             # Prepare frames for GIF export
-            # All frames must be centered on the same canvas size
             export_frames = []
             
-            for frame in self.frames:
-                # Create a canvas of max size with transparency
-                canvas = Image.new('RGBA', (max_width, max_height), (0, 0, 0, 0))
-                
-                # Center the frame on the canvas
-                x_offset = (max_width - frame.width) // 2
-                y_offset = (max_height - frame.height) // 2
-                canvas.paste(frame, (x_offset, y_offset), frame)
-                
-                # Convert RGBA canvas to P mode with transparency
-                if canvas.mode == 'RGBA':
-                    # Create an alpha mask
-                    alpha = canvas.split()[-1]
-                    # Convert to RGB first with transparent background
-                    rgb_frame = Image.new('RGB', canvas.size, (255, 255, 255))
-                    rgb_frame.paste(canvas, mask=alpha)
-                    # Convert to palette mode with transparency
-                    p_frame = rgb_frame.convert('P', palette=Image.ADAPTIVE, colors=255)
-                    # Set transparency index
-                    p_frame.info['transparency'] = 255
-                    export_frames.append(p_frame)
-                else:
-                    export_frames.append(canvas.convert('P', palette=Image.ADAPTIVE))
+            for frame_indices in deltas:
+                p_frame = Image.frombytes(
+                    'P', (max_width, max_height),
+                    np.ascontiguousarray(frame_indices).tobytes()
+                )
+                p_frame.putpalette(palette)
+                export_frames.append(p_frame)
             
             # Save with proper settings
             export_frames[0].save(
                 path,
                 save_all=True,
                 append_images=export_frames[1:],
-                duration=duration,  # Use exact ms per frame
+                duration=durations,  # Exact ms per frame (merged for repeats)
                 loop=0,  # Infinite loop
-                disposal=2,  # Restore to background
+                disposal=disposal,  # Keep or restore to background per frame
+                transparency=0,  # Shared transparent palette index
+                palette=palette,
                 optimize=False  # Don't optimize to preserve timing accuracy
             )
             
@@ -658,7 +1171,7 @@ class CoinAnimatorTab(QWidget):
                 f"GIF exported successfully!\n"
                 f"{os.path.basename(path)}\n\n"
                 f"Size: {max_width}×{max_height}px\n"
-                f"Frames: {len(self.frames)}\n"
+                f"Frames: {len(self.frames_np)}\n"
                 f"Timing: {duration}ms per frame ({self.fps:.1f} FPS)\n"
                 f"File size: {actual_size:.2f} MB"
             )
@@ -667,7 +1180,7 @@ class CoinAnimatorTab(QWidget):
     
     def export_spritesheet(self):
         """Export frames as a spritesheet"""
-        if not self.frames:
+        if self.frames_np is None:
             QMessageBox.warning(self, "No Frames", "Please load an image first!")
             return
         
@@ -686,36 +1199,29 @@ class CoinAnimatorTab(QWidget):
         
         try:
             # Calculate grid dimensions
-            num_frames = len(self.frames)
+            num_frames = len(self.frames_np)
             cols = int(np.ceil(np.sqrt(num_frames)))
             rows = int(np.ceil(num_frames / cols))
             
-            max_w = max(f.width for f in self.frames)
-            max_h = max(f.height for f in self.frames)
+            max_h, max_w = self.frames_np.shape[1:3]
             
             sheet_width = max_w * cols
             sheet_height = max_h * rows
             
-            sheet = Image.new(
-                "RGBA",
-                (sheet_width, sheet_height),
-                (0, 0, 0, 0)
-            )
+            # Frames are already centered on a transparent canvas, so the
+            # sheet is a plain block copy - no per-frame alpha blending
+            sheet = np.zeros((sheet_height, sheet_width, 4), dtype=np.uint8)
             
-            for i, frame in enumerate(self.frames):
+            for i, frame_np in enumerate(self.frames_np):
                 row = i // cols
                 col = i % cols
                 
-                # Center each frame in its cell
-                x_offset = (max_w - frame.width) // 2
-                y_offset = (max_h - frame.height) // 2
+                x_pos = col * max_w
+                y_pos = row * max_h
                 
-                x_pos = col * max_w + x_offset
-                y_pos = row * max_h + y_offset
-                
-                sheet.paste(frame, (x_pos, y_pos), frame)
+                sheet[y_pos:y_pos + max_h, x_pos:x_pos + max_w] = frame_np
             
-            sheet.save(path)
+            Image.fromarray(sheet).save(path)
             
             # Get actual file size
             actual_size = os.path.getsize(path) / (1024 * 1024)
@@ -740,7 +1246,14 @@ class SheetToGifTab(QWidget):
         
         self.spritesheet = None
         self.spritesheet_path = ""
+        self._sheet_np = None  # Decoded RGBA pixels of the loaded sheet
         self.frames = []
+        self.frames_np = None  # (frame_count, height, width, 4) RGBA tensor
+        self._max_dims = (0, 0)  # Largest frame (width, height), set on extraction
+        self._shown_frame = None
+        self._pix_cache = OrderedDict()  # Frame index -> smooth preview-sized pixmap (LRU)
+        self._shown_key = None  # Cache key of the pixmap on screen
+        self._preview_size = None  # Last preview size seen by the resize filter
         self.frame_index = 0
         
         # Frame settings
@@ -755,8 +1268,19 @@ class SheetToGifTab(QWidget):
         self.use_fps = True
         
         self.timer = QTimer()
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self.next_frame)
         
+        # Playback clock - frames are picked from elapsed time so the timer's
+        # integer interval and late ticks don't make the animation drift
+        self._play_t0 = 0.0
+        self._play_start_index = 0
+        
+        # GIF export runs on a worker thread
+        self.export_thread = None
+        self.export_worker = None
+        self._export_info = None
+        
         self.init_ui()
     
     def init_ui(self):
@@ -792,6 +1316,7 @@ class SheetToGifTab(QWidget):
             font-size: 13px;
         """)
         self.preview.setMinimumSize(500, 400)
+        self.preview.installEventFilter(self)
         preview_layout.addWidget(self.preview)
         
         layout.addWidget(preview_container, 3)
@@ -821,28 +1346,13 @@ class SheetToGifTab(QWidget):
         controls_layout.addWidget(load_btn)
         
         # Frame Dimensions Group
-        dims_group = QGroupBox("Frame Dimensions")
-        dims_layout = QGridLayout()
-        
-        dims_layout.addWidget(QLabel("Width:"), 0, 0)
-        self.width_spinbox = QSpinBox()
-        self.width_spinbox.setRange(1, 10000)
-        self.width_spinbox.setValue(self.frame_width)
-        self.width_spinbox.valueChanged.connect(self.update_frame_width)
-        dims_layout.addWidget(self.width_spinbox, 0, 1)
-        
-        dims_layout.addWidget(QLabel("Height:"), 1, 0)
-        self.height_spinbox = QSpinBox()
-        self.height_spinbox.setRange(1, 10000)
-        self.height_spinbox.setValue(self.frame_height)
-        self.height_spinbox.valueChanged.connect(self.update_frame_height)
-        dims_layout.addWidget(self.height_spinbox, 1, 1)
-        
-        extract_btn = QPushButton("Extract Frames")
-        extract_btn.clicked.connect(self.extract_frames)
-        dims_layout.addWidget(extract_btn, 2, 0, 1, 2)
-        
-        dims_group.setLayout(dims_layout)
+        dims_group = FrameDimsGroup(
+            self.frame_width, self.frame_height,
+            self.update_frame_width, self.update_frame_height,
+            "Extract Frames", self.extract_frames
+        )
+        self.width_spinbox = dims_group.width_spinbox
+        self.height_spinbox = dims_group.height_spinbox
         controls_layout.addWidget(dims_group)
         
         # Info Label
@@ -922,6 +1432,12 @@ class SheetToGifTab(QWidget):
         self.export_btn.setEnabled(False)
         controls_layout.addWidget(self.export_btn)
         
+        # Export Progress Bar
+        self.export_progress = QProgressBar()
+        self.export_progress.setRange(0, 100)
+        self.export_progress.setValue(0)
+        controls_layout.addWidget(self.export_progress)
+        
         controls_layout.addStretch()
         
         return controls
@@ -972,7 +1488,8 @@ class SheetToGifTab(QWidget):
         # Update timer if running
         if self.timer.isActive():
             self.timer.stop()
-            interval = int(self.ms_per_frame)
+            interval = int(round(self.ms_per_frame))
+            self.reset_play_clock()
             self.timer.start(interval)
     
     def update_ms(self, value):
@@ -988,7 +1505,8 @@ class SheetToGifTab(QWidget):
         # Update timer if running
         if self.timer.isActive():
             self.timer.stop()
-            interval = int(self.ms_per_frame)
+            interval = int(round(self.ms_per_frame))
+            self.reset_play_clock()
             self.timer.start(interval)
     
     def update_frame_width(self, value):
@@ -997,49 +1515,6 @@ class SheetToGifTab(QWidget):
     def update_frame_height(self, value):
         self.frame_height = value
     
-    def infer_frame_dimensions(self, width, height):
-        """Intelligently infer frame dimensions from spritesheet"""
-        # Common sprite sizes (powers of 2 and common values)
-        common_sizes = [8, 16, 24, 32, 48, 64, 96, 128, 192, 256, 384, 512]
-        
-        # Try to find common divisors
-        best_w = 32  # Default
-        best_h = 32
-        
-        # Check if width/height are divisible by common sizes
-        for size in reversed(common_sizes):
-            if width % size == 0 and height % size == 0:
-                # Perfect square frames possible
-                best_w = size
-                best_h = size
-                break
-            elif width % size == 0 and height >= size:
-                # Width fits, check if height works
-                if height % size == 0:
-                    best_w = size
-                    best_h = size
-                    break
-        
-        # If no perfect match, try rectangular frames
-        if best_w == 32 and best_h == 32:
-            for w_size in reversed(common_sizes):
-                if width % w_size == 0:
-                    best_w = w_size
-                    # Find best height
-                    for h_size in reversed(common_sizes):
-                        if height % h_size == 0:
-                            best_h = h_size
-                            break
-                    break
-        
-        # Sanity check - don't suggest frames larger than the image
-        if best_w > width:
-            best_w = width
-        if best_h > height:
-            best_h = height
-        
-        return best_w, best_h
-    
     def load_spritesheet(self):
         """Load a spritesheet image"""
         path, _ = QFileDialog.getOpenFileName(
@@ -1057,13 +1532,19 @@ class SheetToGifTab(QWidget):
                 except:
                     pass
             
+            self._sheet_np = None
             self.spritesheet = Image.open(path)
             self.spritesheet_path = path
             
+            # Decode and convert once here; every extraction slices this.
+            # Decoding through its own handle keeps self.spritesheet lazy
+            # (header only), so the pixels aren't held twice
+            self._sheet_np = decode_rgba(path)
+            
             width, height = self.spritesheet.size
             
             # Auto-infer frame dimensions
-            inferred_w, inferred_h = self.infer_frame_dimensions(width, height)
+            inferred_w, inferred_h = infer_frame_dims(width, height)
             
             # Update spinboxes with inferred values
             self.width_spinbox.setValue(inferred_w)
@@ -1084,53 +1565,19 @@ class SheetToGifTab(QWidget):
             )
             
             # Stop any playing animation
-            self.stop()
+            self.stop(redraw=False)
             self.frames = []
+            self.frames_np = None
+            self.clear_preview_cache()
             self.play_pause_btn.setEnabled(False)
             self.export_btn.setEnabled(False)
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load spritesheet:\n{str(e)}")
     
-    def is_frame_empty(self, frame):
-        """Check if a frame is empty (fully transparent or uniform color)"""
-        try:
-            # Convert to RGBA if needed
-            if frame.mode != 'RGBA':
-                frame = frame.convert('RGBA')
-            
-            # Get the alpha channel
-            alpha = frame.split()[-1]
-            alpha_data = alpha.getdata()
-            
-            # Check if completely transparent
-            if max(alpha_data) == 0:
-                return True
-            
-            # Get pixel data
-            pixels = list(frame.getdata())
-            
-            # Check if all non-transparent pixels are the same color
-            # (indicates empty/background frame)
-            non_transparent = [p for p in pixels if p[3] > 10]  # Alpha > 10
-            
-            if len(non_transparent) == 0:
-                return True
-            
-            # If less than 1% of pixels are non-transparent, consider empty
-            total_pixels = frame.width * frame.height
-            if len(non_transparent) < total_pixels * 0.01:
-                return True
-            
-            return False
-            
-        except Exception as e:
-            print(f"Error checking if frame is empty: {e}")
-            return False
-    
     def extract_frames(self):
         """Extract frames from the spritesheet"""
-        if not self.spritesheet:
+        if not self.spritesheet or self._sheet_np is None:
             QMessageBox.warning(self, "No Spritesheet", "Please load a spritesheet first!")
             return
         
@@ -1145,25 +1592,32 @@ class SheetToGifTab(QWidget):
                 QMessageBox.critical(self, "Error", "Frame dimensions are larger than spritesheet!")
                 return
             
-            # Extract frames
-            self.frames = []
-            empty_count = 0
-            
-            for row in range(self.frames_y):
-                for col in range(self.frames_x):
-                    left = col * self.frame_width
-                    top = row * self.frame_height
-                    right = left + self.frame_width
-                    bottom = top + self.frame_height
-                    
-                    frame = self.spritesheet.crop((left, top, right, bottom))
-                    
-                    # Check if frame is empty
-                    if self.is_frame_empty(frame):
-                        empty_count += 1
-                        continue  # Skip empty frames
-                    
-                    self.frames.append(frame.copy())
+            # Tiles are sliced from the sheet decoded on load as zero-copy views
+            sheet_np = self._sheet_np
+            
+            # Lay the grid out as a (rows, cols, h, w, 4) tile array. Strides
+            # make it a zero-copy view even when leftover edge pixels keep the
+            # frames from dividing the sheet evenly (a reshape would copy)
+            fw, fh = self.frame_width, self.frame_height
+            row_stride, col_stride, channel_stride = sheet_np.strides
+            tiles = np.lib.stride_tricks.as_strided(
+                sheet_np,
+                shape=(self.frames_y, self.frames_x, fh, fw, 4),
+                strides=(fh * row_stride, fw * col_stride, row_stride, col_stride, channel_stride),
+                writeable=False
+            )
+            
+            # Classify every tile in one pass over the sheet
+            keep = classify_tiles(sheet_np, fw, fh, self.frames_x, self.frames_y)
+            empty_count = total - int(np.count_nonzero(keep))
+            
+            # Only kept frames get their own copy of the pixels, as one
+            # contiguous stack that the PIL frames share. Frames are RGBA from
+            # here on, so nothing downstream converts them again
+            self.frames_np = tiles[keep]
+            self.frames = [Image.fromarray(frame) for frame in self.frames_np]
+            self._max_dims = (fw, fh)  # Every tile has the same size
+            self.clear_preview_cache()
             
             if len(self.frames) == 0:
                 QMessageBox.warning(
@@ -1191,30 +1645,77 @@ class SheetToGifTab(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to extract frames:\n{str(e)}")
     
-    def show_frame(self, index):
-        """Display a specific frame"""
+    def show_frame(self, index, smooth=True):
+        """Display a specific frame (fast scaling while playing, smooth when paused)"""
         if not self.frames or index >= len(self.frames):
             return
         
         try:
-            frame = self.frames[index]
-            qt_img = ImageQt.ImageQt(frame)
-            pix = QPixmap.fromImage(qt_img)
-            self.preview.setPixmap(
-                pix.scaled(
-                    self.preview.size(),
+            # Already on screen - nothing to do
+            key = (index, smooth)
+            if key == self._shown_key:
+                return
+            
+            # Smooth frames are cached (bounded, until the preview is resized);
+            # fast scaling is cheap enough to redo on every tick
+            scaled = self._pix_cache.get(index) if smooth else None
+            if scaled is not None:
+                self._pix_cache.move_to_end(index)
+            else:
+                # Wrap the frame's memory directly instead of going through
+                # ImageQt; keep the array referenced while Qt reads from it
+                self._shown_frame = self.frames_np[index]
+                height, width = self._shown_frame.shape[:2]
+                qt_img = QImage(
+                    self._shown_frame.data, width, height,
+                    self._shown_frame.strides[0], QImage.Format_RGBA8888
+                )
+                pix = QPixmap.fromImage(qt_img)
+                scaled = pix.scaled(
+                    self._preview_size or self.preview.size(),
                     Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
+                    Qt.SmoothTransformation if smooth else Qt.FastTransformation
                 )
-            )
+                if smooth:
+                    cache_preview(self._pix_cache, index, scaled)
+            
+            self.preview.setPixmap(scaled)
+            self._shown_key = key
         except Exception as e:
             print(f"Error displaying frame: {e}")
     
+    def eventFilter(self, obj, event):
+        """Drop cached preview pixmaps when the preview is resized"""
+        if obj is self.preview and event.type() == QEvent.Resize:
+            self.clear_preview_cache()
+            self._preview_size = self.preview.size()
+        return super().eventFilter(obj, event)
+    
+    def clear_preview_cache(self):
+        """Forget scaled preview pixmaps so the next frame is rescaled"""
+        self._pix_cache = OrderedDict()
+        self._shown_key = None
+    
+    def reset_play_clock(self):
+        """Restart the playback clock from the current frame"""
+        self._play_t0 = time.perf_counter()
+        self._play_start_index = self.frame_index
+    
     def next_frame(self):
-        """Advance to the next frame"""
-        if self.frames:
-            self.frame_index = (self.frame_index + 1) % len(self.frames)
-            self.show_frame(self.frame_index)
+        """Advance to the frame due at the current time"""
+        if not self.frames:
+            return
+        
+        # Nothing to draw while the preview can't be seen
+        if not self.preview.isVisible() or self.window().isMinimized():
+            return
+        
+        # Catch up (or drop frames) to stay on the wall-clock timeline
+        elapsed_frames = int((time.perf_counter() - self._play_t0) * 1000 / self.ms_per_frame)
+        index = (self._play_start_index + elapsed_frames) % len(self.frames)
+        if index != self.frame_index:
+            self.frame_index = index
+            self.show_frame(self.frame_index, smooth=False)
     
     def toggle_playback(self):
         """Toggle animation playback"""
@@ -1222,10 +1723,10 @@ class SheetToGifTab(QWidget):
             return
         
         if self.timer.isActive():
-            self.timer.stop()
-            self.play_pause_btn.setText("▶ Play")
+            self.stop()
         else:
-            interval = int(self.ms_per_frame)
+            interval = int(round(self.ms_per_frame))
+            self.reset_play_clock()
             self.timer.start(interval)
             self.play_pause_btn.setText("⏸ Pause")
     
@@ -1233,14 +1734,20 @@ class SheetToGifTab(QWidget):
         """Start animation playback"""
         if not self.frames:
             return
-        interval = int(self.ms_per_frame)
+        interval = int(round(self.ms_per_frame))
+        self.reset_play_clock()
         self.timer.start(interval)
         self.play_pause_btn.setText("⏸ Pause")
     
-    def stop(self):
+    def stop(self, redraw=True):
         """Stop animation playback"""
         self.timer.stop()
         self.play_pause_btn.setText("▶ Play")
+        
+        # Redraw the frame left on screen at full quality - not when the
+        # frames are about to be thrown away
+        if redraw:
+            self.show_frame(self.frame_index)
     
     def pause_on_hide(self):
         """Pause animation when tab is hidden"""
@@ -1250,9 +1757,8 @@ class SheetToGifTab(QWidget):
     def estimate_gif_size(self, frames, duration):
         """Estimate the file size of the GIF in MB"""
         try:
-            # Find max dimensions
-            max_width = max(f.width for f in frames)
-            max_height = max(f.height for f in frames)
+            # Max dimensions, recorded when the frames were extracted
+            max_width, max_height = self._max_dims
             
             # Rough estimation: 
             # Each frame in palette mode ≈ width × height bytes (with compression)
@@ -1278,6 +1784,10 @@ class SheetToGifTab(QWidget):
             QMessageBox.warning(self, "No Frames", "Please extract frames first!")
             return
         
+        # Only one export at a time
+        if self.export_thread:
+            return
+        
         timestamp = datetime.now().strftime("%H%M%S")
         default_name = f"animation_{timestamp}.gif"
         
@@ -1294,45 +1804,56 @@ class SheetToGifTab(QWidget):
             # Use exact milliseconds per frame
             duration = int(round(self.ms_per_frame))
             
-            # Find maximum dimensions across all frames
-            max_width = max(f.width for f in self.frames)
-            max_height = max(f.height for f in self.frames)
-            
-            # Prepare frames for GIF export
-            # All frames must be centered on the same canvas size
-            export_frames = []
+            # Maximum dimensions across all frames, found on extraction
+            max_width, max_height = self._max_dims
             
-            for frame in self.frames:
-                # Create a canvas of max size with transparency
-                canvas = Image.new('RGBA', (max_width, max_height), (0, 0, 0, 0))
-                
-                # Center the frame on the canvas
-                x_offset = (max_width - frame.width) // 2
-                y_offset = (max_height - frame.height) // 2
-                canvas.paste(frame, (x_offset, y_offset), frame if frame.mode == 'RGBA' else None)
-                
-                # Convert to proper mode for GIF
-                if canvas.mode == 'RGBA':
-                    alpha = canvas.split()[-1]
-                    rgb_frame = Image.new('RGB', canvas.size, (255, 255, 255))
-                    rgb_frame.paste(canvas, mask=alpha)
-                    p_frame = rgb_frame.convert('P', palette=Image.ADAPTIVE, colors=255)
-                    p_frame.info['transparency'] = 255
-                    export_frames.append(p_frame)
-                else:
-                    export_frames.append(canvas.convert('P', palette=Image.ADAPTIVE))
+            # Details for the completion message
+            self._export_info = (max_width, max_height, len(self.frames), duration, self.fps)
             
-            # Save GIF
-            export_frames[0].save(
-                path,
-                save_all=True,
-                append_images=export_frames[1:],
-                duration=duration,
-                loop=0,
-                disposal=2,
-                optimize=False
+            # Create worker and thread
+            self.export_thread = QThread()
+            self.export_worker = GifExportWorker(
+                list(self.frames), path, duration, max_width, max_height
             )
+            self.export_worker.moveToThread(self.export_thread)
+            
+            # Connect signals
+            self.export_thread.started.connect(self.export_worker.run)
+            self.export_worker.progress.connect(self.export_progress.setValue)
+            self.export_worker.finished.connect(self.export_finished)
+            self.export_worker.error.connect(self.export_error)
+            
+            # Cleanup on finish
+            self.export_worker.finished.connect(self.export_thread.quit)
+            self.export_worker.error.connect(self.export_thread.quit)
+            self.export_thread.finished.connect(self.cleanup_export_worker)
+            
+            # Update UI
+            self.export_btn.setEnabled(False)
+            self.export_progress.setValue(0)
+            
+            # Start thread
+            self.export_thread.start()
             
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to export GIF:\n{str(e)}")
+            self.cleanup_export_worker()
+    
+    def cleanup_export_worker(self):
+        """Clean up export worker and thread"""
+        if self.export_worker:
+            self.export_worker.deleteLater()
+            self.export_worker = None
+        if self.export_thread:
+            self.export_thread.deleteLater()
+            self.export_thread = None
+    
+    def export_finished(self, path):
+        """Handle successful GIF export"""
+        self.export_btn.setEnabled(bool(self.frames))
+        max_width, max_height, frame_count, duration, fps = self._export_info
+        
+        try:
             # Get actual file size
             actual_size = os.path.getsize(path) / (1024 * 1024)
             
@@ -1341,22 +1862,39 @@ class SheetToGifTab(QWidget):
                 f"GIF exported successfully!\n"
                 f"{os.path.basename(path)}\n\n"
                 f"Size: {max_width}×{max_height}px\n"
-                f"Frames: {len(self.frames)}\n"
-                f"Timing: {duration}ms per frame ({self.fps:.1f} FPS)\n"
+                f"Frames: {frame_count}\n"
+                f"Timing: {duration}ms per frame ({fps:.1f} FPS)\n"
                 f"File size: {actual_size:.2f} MB"
             )
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to export GIF:\n{str(e)}")
     
+    def export_error(self, error_msg):
+        """Handle GIF export error"""
+        self.export_btn.setEnabled(bool(self.frames))
+        self.export_progress.setValue(0)
+        QMessageBox.critical(self, "Error", f"Failed to export GIF:\n{error_msg}")
+    
     def cleanup(self):
         """Cleanup resources"""
-        self.stop()
+        self.stop(redraw=False)
+        
+        # Stop export worker if running
+        if self.export_worker:
+            self.export_worker.stop()
+        if self.export_thread and self.export_thread.isRunning():
+            self.export_thread.quit()
+            self.export_thread.wait(2000)
+        
         if self.spritesheet:
             try:
                 self.spritesheet.close()
             except:
                 pass
+        self._sheet_np = None
         self.frames = []
+        self.frames_np = None
+        self.clear_preview_cache()
 
 
 class SpriteSheetSplitterTab(QWidget):
@@ -1374,10 +1912,25 @@ class SpriteSheetSplitterTab(QWidget):
         self.padding = 4
         
         self.cached_spritesheet = None
+        self.cached_array = None  # RGBA pixels of the cached spritesheet
         self.cached_path = None
+        self._preview_cache = {}  # (path, frame_w, frame_h) -> preview text
+        self._load_task = None  # Background decode of the selected sheet
         self.worker_thread = None
         self.worker = None
         
+        # Coalesces bursts of frame size edits into one preview update
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(100)
+        self._preview_timer.timeout.connect(self.calculate_preview)
+        
+        # Frees the cached sheet once the tab has been hidden for a while
+        self._release_timer = QTimer(self)
+        self._release_timer.setSingleShot(True)
+        self._release_timer.setInterval(60000)
+        self._release_timer.timeout.connect(self.release_cache)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -1421,28 +1974,14 @@ class SpriteSheetSplitterTab(QWidget):
         main_layout.addWidget(preview_group)
         
         # Frame Dimensions
-        dims_group = QGroupBox("Frame Dimensions")
-        dims_layout = QGridLayout()
-        
-        dims_layout.addWidget(QLabel("Width:"), 0, 0)
-        self.width_spinbox = QSpinBox()
-        self.width_spinbox.setRange(1, 10000)
-        self.width_spinbox.setValue(self.frame_width)
-        self.width_spinbox.valueChanged.connect(self.update_frame_width)
-        dims_layout.addWidget(self.width_spinbox, 0, 1)
-        
-        dims_layout.addWidget(QLabel("Height:"), 0, 2)
-        self.height_spinbox = QSpinBox()
-        self.height_spinbox.setRange(1, 10000)
-        self.height_spinbox.setValue(self.frame_height)
-        self.height_spinbox.valueChanged.connect(self.update_frame_height)
-        dims_layout.addWidget(self.height_spinbox, 0, 3)
-        
-        calc_btn = QPushButton("Calculate Preview")
-        calc_btn.clicked.connect(self.calculate_preview)
-        dims_layout.addWidget(calc_btn, 0, 4)
-        
-        dims_group.setLayout(dims_layout)
+        dims_group = FrameDimsGroup(
+            self.frame_width, self.frame_height,
+            self.update_frame_width, self.update_frame_height,
+            "Calculate Preview", self.calculate_preview,
+            horizontal=True
+        )
+        self.width_spinbox = dims_group.width_spinbox
+        self.height_spinbox = dims_group.height_spinbox
         main_layout.addWidget(dims_group)
         
         # Output Settings
@@ -1477,6 +2016,26 @@ class SpriteSheetSplitterTab(QWidget):
         self.padding_spinbox.valueChanged.connect(self.update_example)
         output_layout.addWidget(self.padding_spinbox, 3, 1)
         
+        self.fast_save_checkbox = QCheckBox("Fast save (larger files)")
+        self.fast_save_checkbox.setToolTip("Use light PNG compression - much faster to write")
+        self.fast_save_checkbox.setChecked(True)
+        output_layout.addWidget(self.fast_save_checkbox, 4, 0, 1, 2)
+        
+        output_layout.addWidget(QLabel("Format:"), 5, 0)
+        format_layout = QHBoxLayout()
+        self.format_group = QButtonGroup()
+        self.png_radio = QRadioButton("PNG (compressed)")
+        self.tga_radio = QRadioButton("TGA (fast)")
+        self.tga_radio.setToolTip("Uncompressed with alpha - no encoding cost, much larger files")
+        self.png_radio.setChecked(True)
+        self.format_group.addButton(self.png_radio)
+        self.format_group.addButton(self.tga_radio)
+        self.png_radio.toggled.connect(self.update_format)
+        format_layout.addWidget(self.png_radio)
+        format_layout.addWidget(self.tga_radio)
+        format_layout.addStretch()
+        output_layout.addLayout(format_layout, 5, 1, 1, 2)
+        
         output_group.setLayout(output_layout)
         main_layout.addWidget(output_group)
         
@@ -1513,9 +2072,16 @@ class SpriteSheetSplitterTab(QWidget):
     
     def update_frame_width(self, value):
         self.frame_width = value
+        self.schedule_preview()
     
     def update_frame_height(self, value):
         self.frame_height = value
+        self.schedule_preview()
+    
+    def schedule_preview(self):
+        """Refresh the preview once the frame size stops changing"""
+        if self.spritesheet_path:
+            self._preview_timer.start()
     
     def update_example(self):
         """Update the example filename"""
@@ -1523,53 +2089,18 @@ class SpriteSheetSplitterTab(QWidget):
             prefix = self.prefix_edit.text() or "frame"
             start = self.start_index_spinbox.value()
             pad = self.padding_spinbox.value()
-            example = f"Example: {prefix}_{str(start).zfill(pad)}.png"
+            ext = "png" if self.png_radio.isChecked() else "tga"
+            example = f"Example: {prefix}_{str(start).zfill(pad)}.{ext}"
             self.example_label.setText(example)
         except:
             self.example_label.setText("Example: Invalid settings")
     
-    def infer_frame_dimensions(self, width, height):
-        """Intelligently infer frame dimensions from spritesheet"""
-        # Common sprite sizes (powers of 2 and common values)
-        common_sizes = [8, 16, 24, 32, 48, 64, 96, 128, 192, 256, 384, 512]
-        
-        # Try to find common divisors
-        best_w = 32  # Default
-        best_h = 32
-        
-        # Check if width/height are divisible by common sizes
-        for size in reversed(common_sizes):
-            if width % size == 0 and height % size == 0:
-                # Perfect square frames possible
-                best_w = size
-                best_h = size
-                break
-            elif width % size == 0 and height >= size:
-                # Width fits, check if height works
-                if height % size == 0:
-                    best_w = size
-                    best_h = size
-                    break
-        
-        # If no perfect match, try rectangular frames
-        if best_w == 32 and best_h == 32:
-            for w_size in reversed(common_sizes):
-                if width % w_size == 0:
-                    best_w = w_size
-                    # Find best height
-                    for h_size in reversed(common_sizes):
-                        if height % h_size == 0:
-                            best_h = h_size
-                            break
-                    break
-        
-        # Sanity check - don't suggest frames larger than the image
-        if best_w > width:
-            best_w = width
-        if best_h > height:
-            best_h = height
-        
-        return best_w, best_h
+    def update_format(self):
+        """Compression settings only apply to PNG output"""
+        self.fast_save_checkbox.setEnabled(self.png_radio.isChecked())
+        self.update_example()
+        # The disk space estimate depends on the format
+        self.schedule_preview()
     
     def browse_spritesheet(self):
         """Browse for a spritesheet image"""
@@ -1592,7 +2123,7 @@ class SpriteSheetSplitterTab(QWidget):
                 width, height = img.size
                 
                 # Auto-infer frame dimensions
-                inferred_w, inferred_h = self.infer_frame_dimensions(width, height)
+                inferred_w, inferred_h = infer_frame_dims(width, height)
                 
                 # Update spinboxes with inferred values
                 self.width_spinbox.setValue(inferred_w)
@@ -1603,6 +2134,9 @@ class SpriteSheetSplitterTab(QWidget):
                 # Calculate preview
                 self.calculate_preview()
                 
+                # Decode the pixels off the GUI thread
+                self.start_sheet_decode()
+                
             except Exception as e:
                 self.preview_label.setText(f"Error loading: {str(e)}")
     
@@ -1625,22 +2159,74 @@ class SpriteSheetSplitterTab(QWidget):
             except:
                 pass
         self.cached_spritesheet = None
+        self.cached_array = None
         self.cached_path = None
+        self._preview_cache.clear()
+    
+    def pause_on_hide(self):
+        """Release the cached spritesheet if the tab stays hidden for a while"""
+        self._release_timer.start()
+    
+    def resume_on_show(self):
+        """Keep the cached spritesheet while the tab is shown"""
+        self._release_timer.stop()
+    
+    def release_cache(self):
+        """Free the cached spritesheet when it isn't on screen
+        
+        A running split holds its own reference; the sheet is reopened (and
+        decoded again if needed) on the next split.
+        """
+        if self.isVisible() and not self.window().isMinimized():
+            return
+        
+        # Don't throw away a decode that is still running - look again later
+        if self._load_task is not None:
+            self._release_timer.start()
+            return
+        
+        self.clear_cache()
     
     def load_spritesheet(self):
-        """Load and cache the spritesheet"""
+        """Open and cache the spritesheet - Pillow only reads the header here"""
         if self.cached_path != self.spritesheet_path or self.cached_spritesheet is None:
             self.clear_cache()
             self.cached_spritesheet = Image.open(self.spritesheet_path)
             self.cached_path = self.spritesheet_path
         return self.cached_spritesheet
     
+    def start_sheet_decode(self):
+        """Decode the selected spritesheet in the background, ready for splitting
+        
+        Decoding goes through its own file handle, so the cached handle stays
+        lazy (header only) and the pixels live only in cached_array.
+        """
+        task = SheetLoadTask(self.spritesheet_path)
+        task.signals.loaded.connect(self.sheet_decoded)
+        self._load_task = task
+        QThreadPool.globalInstance().start(task)
+    
+    def sheet_decoded(self, path, sheet_np):
+        """Cache a decoded sheet, unless another file was selected meanwhile"""
+        if self._load_task is not None and self._load_task.path == path:
+            self._load_task = None
+        if path == self.cached_path and self.cached_array is None:
+            self.cached_array = sheet_np
+    
     def calculate_preview(self):
         """Calculate and display preview information"""
         if not self.spritesheet_path:
             self.preview_label.setText("No spritesheet loaded")
             return
         
+        # Same sheet, frame size and format as before - reuse the text
+        tga = self.tga_radio.isChecked()
+        key = (self.spritesheet_path, self.frame_width, self.frame_height, tga)
+        info = self._preview_cache.get(key)
+        if info is not None:
+            self.preview_label.setText(info)
+            return
+        
         try:
             img = self.load_spritesheet()
             width, height = img.size
@@ -1657,9 +2243,13 @@ class SpriteSheetSplitterTab(QWidget):
             unused_height = height % frame_h
             
             # Estimate disk space needed
-            # PNG compression varies, but typically 2-4 bytes per pixel for RGBA
-            # Using 3 bytes as average
-            bytes_per_frame = frame_w * frame_h * 3
+            if tga:
+                # Uncompressed TGA: 4 bytes per RGBA pixel plus an 18-byte header
+                bytes_per_frame = frame_w * frame_h * 4 + 18
+            else:
+                # PNG compression varies, but typically 2-4 bytes per pixel for RGBA
+                # Using 3 bytes as average
+                bytes_per_frame = frame_w * frame_h * 3
             estimated_total_mb = (bytes_per_frame * total) / (1024 * 1024)
             
             info = (
@@ -1672,32 +2262,13 @@ class SpriteSheetSplitterTab(QWidget):
             if unused_width > 0 or unused_height > 0:
                 info += f"\n⚠ Warning: {unused_width}px width and {unused_height}px height will be unused"
             
+            self._preview_cache[key] = info
             self.preview_label.setText(info)
             
         except Exception as e:
             self.preview_label.setText(f"Error: {str(e)}")
             self.clear_cache()
     
-    def validate_output_path(self):
-        """Validate that output path is writable"""
-        output_dir = Path(self.output_path_edit.text())
-        
-        # Check if parent exists
-        if not output_dir.parent.exists():
-            return False, "Parent directory does not exist"
-        
-        # Try to create directory
-        try:
-            output_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            return False, f"Cannot create output directory: {str(e)}"
-        
-        # Check if writable
-        if not os.access(output_dir, os.W_OK):
-            return False, "Output directory is not writable"
-        
-        return True, ""
-    
     def start_split(self):
         """Start the splitting process"""
         if not self.spritesheet_path:
@@ -1708,12 +2279,6 @@ class SpriteSheetSplitterTab(QWidget):
             QMessageBox.critical(self, "Error", "Frame dimensions must be positive")
             return
         
-        # Validate output path
-        valid, error_msg = self.validate_output_path()
-        if not valid:
-            QMessageBox.critical(self, "Error", f"Invalid output path:\n{error_msg}")
-            return
-        
         # Validate prefix
         prefix = self.prefix_edit.text().strip()
         if not prefix:
@@ -1721,16 +2286,21 @@ class SpriteSheetSplitterTab(QWidget):
             return
         
         try:
-            spritesheet = self.load_spritesheet()
+            # The sheet is normally decoded by now; if not, the worker does it
+            self.load_spritesheet()
+            sheet_np = self.cached_array
             output_dir = Path(self.output_path_edit.text())
             start = self.start_index_spinbox.value()
             pad = self.padding_spinbox.value()
+            compress_level = 1 if self.fast_save_checkbox.isChecked() else 6
+            image_format = "PNG" if self.png_radio.isChecked() else "TGA"
             
             # Create worker and thread
             self.worker_thread = QThread()
             self.worker = SplitterWorker(
-                spritesheet, self.frame_width, self.frame_height,
-                output_dir, prefix, start, pad
+                sheet_np, self.frame_width, self.frame_height,
+                output_dir, prefix, start, pad, compress_level,
+                sheet_path=self.spritesheet_path, image_format=image_format
             )
             self.worker.moveToThread(self.worker_thread)
             
@@ -1761,11 +2331,17 @@ class SpriteSheetSplitterTab(QWidget):
     def cleanup_worker(self):
         """Clean up worker and thread"""
         if self.worker:
+            # Drop the worker's sheet reference now rather than whenever Qt
+            # gets around to deleting the worker
+            self.worker.sheet_np = None
             self.worker.deleteLater()
             self.worker = None
         if self.worker_thread:
             self.worker_thread.deleteLater()
             self.worker_thread = None
+        
+        # Hand the sheet-sized buffers of the run back to the allocator
+        gc.collect()
     
     def update_progress(self, value):
         """Update progress bar"""
@@ -1800,8 +2376,19 @@ class SpriteSheetSplitterTab(QWidget):
             self.worker_thread.quit()
             self.worker_thread.wait(2000)
         
+        # The worker must not keep the sheet alive past the cache
+        if self.worker:
+            self.worker.sheet_np = None
+        
+        self._release_timer.stop()
+        
+        # Let a background decode finish before the tab goes away
+        QThreadPool.globalInstance().waitForDone(2000)
+        self._load_task = None
+        
         # Clear cache
         self.clear_cache()
+        gc.collect()
         
         # Reset UI
         self.progress_bar.setValue(0)
@@ -1810,66 +2397,8 @@ class SpriteSheetSplitterTab(QWidget):
 class SpriteToolkitApp(QMainWindow):
     """Main application window with tabbed interface"""
     
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Sprite Toolkit - Animation & Spritesheet Tools")
-        self.setMinimumSize(1100, 750)
-        
-        self.init_ui()
-        self.apply_styles()
-    
-    def init_ui(self):
-        """Initialize the UI"""
-        central = QWidget()
-        self.setCentralWidget(central)
-        
-        layout = QVBoxLayout(central)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Create tab widget
-        self.tabs = QTabWidget()
-        self.tabs.setTabPosition(QTabWidget.North)
-        
-        # Add tabs
-        self.coin_animator = CoinAnimatorTab()
-        self.sheet_to_gif = SheetToGifTab()
-        self.spritesheet_splitter = SpriteSheetSplitterTab()
-        
-        self.tabs.addTab(self.coin_animator, "🪙 Coin Animator")
-        self.tabs.addTab(self.sheet_to_gif, "🎬 Sheet to GIF")
-        self.tabs.addTab(self.spritesheet_splitter, "✂ Spritesheet Splitter")
-        
-        # Connect tab change to pause animations
-        self.tabs.currentChanged.connect(self.on_tab_changed)
-        
-        layout.addWidget(self.tabs)
-    
-    def on_tab_changed(self, index):
-        """Handle tab change - pause animations when not visible"""
-        # Pause coin animator when switching away from it
-        if index != 0:
-            self.coin_animator.pause_on_hide()
-        
-        # Pause sheet to gif when switching away from it
-        if index != 1:
-            self.sheet_to_gif.pause_on_hide()
-    
-    def closeEvent(self, event):
-        """Handle application close - cleanup resources"""
-        # Stop coin animator
-        self.coin_animator.cleanup()
-        
-        # Stop sheet to gif
-        self.sheet_to_gif.cleanup()
-        
-        # Stop spritesheet splitter
-        self.spritesheet_splitter.cleanup()
-        
-        event.accept()
-    
-    def apply_styles(self):
-        """Apply global stylesheet"""
-        self.setStyleSheet("""
+    # Global stylesheet, parsed by Qt when applied
+    STYLESHEET = """
             QMainWindow {
                 background: #1a1a1a;
             }
@@ -2000,7 +2529,82 @@ class SpriteToolkitApp(QMainWindow):
             QRadioButton::indicator:hover {
                 border: 2px solid #7db4f5;
             }
-        """)
+        """
+    
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Sprite Toolkit - Animation & Spritesheet Tools")
+        self.setMinimumSize(1100, 750)
+        
+        # Style first, so each widget is polished once as it is created
+        # instead of restyled again once the whole tree exists
+        self.apply_styles()
+        self.init_ui()
+    
+    def init_ui(self):
+        """Initialize the UI"""
+        central = QWidget()
+        self.setCentralWidget(central)
+        
+        layout = QVBoxLayout(central)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Create tab widget
+        self.tabs = QTabWidget()
+        self.tabs.setTabPosition(QTabWidget.North)
+        
+        # Add tabs
+        self.coin_animator = CoinAnimatorTab()
+        self.sheet_to_gif = SheetToGifTab()
+        self.spritesheet_splitter = SpriteSheetSplitterTab()
+        
+        self.tabs.addTab(self.coin_animator, "🪙 Coin Animator")
+        self.tabs.addTab(self.sheet_to_gif, "🎬 Sheet to GIF")
+        self.tabs.addTab(self.spritesheet_splitter, "✂ Spritesheet Splitter")
+        
+        # Connect tab change to pause animations
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+        
+        layout.addWidget(self.tabs)
+    
+    def on_tab_changed(self, index):
+        """Handle tab change - pause animations when not visible"""
+        # Pause coin animator when switching away from it
+        if index != 0:
+            self.coin_animator.pause_on_hide()
+        
+        # Pause sheet to gif when switching away from it
+        if index != 1:
+            self.sheet_to_gif.pause_on_hide()
+        
+        # Free the splitter's cached sheet if it stays out of view
+        if index != 2:
+            self.spritesheet_splitter.pause_on_hide()
+        else:
+            self.spritesheet_splitter.resume_on_show()
+    
+    def changeEvent(self, event):
+        """Free the splitter's cached sheet when the window is minimized"""
+        if event.type() == QEvent.WindowStateChange and self.isMinimized():
+            self.spritesheet_splitter.release_cache()
+        super().changeEvent(event)
+    
+    def closeEvent(self, event):
+        """Handle application close - cleanup resources"""
+        # Stop coin animator
+        self.coin_animator.cleanup()
+        
+        # Stop sheet to gif
+        self.sheet_to_gif.cleanup()
+        
+        # Stop spritesheet splitter
+        self.spritesheet_splitter.cleanup()
+        
+        event.accept()
+    
+    def apply_styles(self):
+        """Apply global stylesheet"""
+        self.setStyleSheet(self.STYLESHEET)
 
 
 def main():